@@ -2,10 +2,20 @@
 
 import os
 import json
+import threading
+import numpy as np
 import pandas as pd
+import polars as pl
 import streamlit as st
-import altair as alt
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import io
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson as _json_backend
+except ImportError:  # orjson é opcional; json da stdlib também aceita bytes
+    _json_backend = json
 
 # ------------------------------------------------------------
 # 1) Importa ReportLab e Matplotlib para gerar PDF com gráficos
@@ -24,55 +34,30 @@ from reportlab.platypus import (
 from reportlab.lib.units import cm
 from reportlab.lib.enums import TA_LEFT
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.transforms import offset_copy
 
 
 # ------------------------------------------------------------
 # 2) Função para carregar os JSONs de cada jogador
 # ------------------------------------------------------------
-@st.cache_data
-def load_player_data(player_dir):
+def _read_json(path):
     """
-    Para um diretório de jogador (ex: "players/AlphaWolf.DD"), carrega:
-      - overview.json
-      - maps.json
-      - operators.json
-
-    Retorna uma tupla (overview_json, maps_json, ops_json).
-    Qualquer um dos três que não exista retorna None.
+    Lê um arquivo JSON em modo binário e faz o parse com orjson (ou json, se indisponível).
     """
-    overview_path = os.path.join(player_dir, "overview.json")
-    maps_path = os.path.join(player_dir, "maps.json")
-    ops_path = os.path.join(player_dir, "operators.json")
-
-    overview = None
-    maps = None
-    ops = None
-
-    if os.path.isfile(overview_path):
-        with open(overview_path, "r", encoding="utf-8") as f:
-            overview = json.load(f)
-
-    if os.path.isfile(maps_path):
-        with open(maps_path, "r", encoding="utf-8") as f:
-            maps = json.load(f)
-
-    if os.path.isfile(ops_path):
-        with open(ops_path, "r", encoding="utf-8") as f:
-            ops = json.load(f)
-
-    return overview, maps, ops
+    with open(path, "rb") as f:
+        return _json_backend.loads(f.read())
 
 
 # ------------------------------------------------------------
-# 3) Funções de parsing para DataFrames
+# 3) Funções de parsing para DataFrames (Polars)
 # ------------------------------------------------------------
 def parse_overview_to_df(overview_json, player_name):
     """
     Extrai do overview.json os principais indicadores:
       - matchesPlayed, matchesWon, matchesLost, winPct, kills, deaths, kdRatio
 
-    Retorna um DataFrame de uma linha:
+    Retorna um DataFrame (Polars) de uma linha:
         [player, matchesPlayed, matchesWon, matchesLost, winPct, kills, deaths, kdRatio]
     """
     segmento_overview = None
@@ -82,7 +67,7 @@ def parse_overview_to_df(overview_json, player_name):
             break
 
     if segmento_overview is None:
-        return pd.DataFrame()
+        return pl.DataFrame()
 
     stats = segmento_overview.get("stats", {})
 
@@ -100,83 +85,90 @@ def parse_overview_to_df(overview_json, player_name):
         "deaths": get_stat("deaths"),
         "kdRatio": get_stat("kdRatio"),
     }
-    return pd.DataFrame([data])
+    return pl.DataFrame([data])
+
+
+# Estatísticas extraídas de maps.json / operators.json: coluna do DataFrame -> (chave em "stats", tipo)
+STATS_COLUMNS = {
+    "matchesPlayed": ("matchesPlayed", pl.Int64),
+    "matchesWon": ("matchesWon", pl.Int64),
+    "winPct": ("winPercentage", pl.Float64),
+    "kills": ("kills", pl.Int64),
+    "deaths": ("deaths", pl.Int64),
+    "kdRatio": ("kdRatio", pl.Float64),
+}
+
+# Schema das entradas de maps.json / operators.json: o from_dicts materializa só estes
+# campos (nomes, lado e as estatísticas de STATS_COLUMNS). Campos ausentes no JSON viram nulos.
+ENTRY_SCHEMA = {
+    "metadata": pl.Struct({"mapName": pl.String, "operatorName": pl.String}),
+    "attributes": pl.Struct({"map": pl.String, "operator": pl.String, "side": pl.String}),
+    "stats": pl.Struct({chave: pl.Struct({"value": dtype}) for chave, dtype in STATS_COLUMNS.values()}),
+}
+
+
+def _entries_to_df(entries):
+    """
+    Converte a lista de entradas (maps.json / operators.json) num DataFrame com ENTRY_SCHEMA.
+    """
+    return pl.from_dicts(entries, schema=ENTRY_SCHEMA)
+
+
+def _stats_exprs():
+    """
+    Expressões com os valores de STATS_COLUMNS; estatísticas ausentes (ou None) viram 0.
+    """
+    return [
+        pl.col("stats").struct.field(chave).struct.field("value").fill_null(0).alias(col)
+        for col, (chave, _) in STATS_COLUMNS.items()
+    ]
 
 
 def parse_maps_to_df(maps_json, player_name):
     """
-    Converte maps.json em DataFrame, extraindo para cada mapa:
+    Converte maps.json em DataFrame (Polars), extraindo para cada mapa:
       - mapName, matchesPlayed, matchesWon, winPct, kills, deaths, kdRatio
 
     Retorna um DataFrame com colunas:
       [player, mapName, matchesPlayed, matchesWon, winPct, kills, deaths, kdRatio]
     """
-    rows = []
-    for entry in maps_json:
-        metadata = entry.get("metadata", {})
-        stats = entry.get("stats", {})
-
-        map_name = metadata.get("mapName", entry.get("attributes", {}).get("map", "Unknown"))
-
-        def get_stat(key):
-            sub = stats.get(key)
-            return sub.get("value") if (sub and sub.get("value") is not None) else 0
-
-        row = {
-            "player": player_name,
-            "mapName": map_name,
-            "matchesPlayed": get_stat("matchesPlayed"),
-            "matchesWon": get_stat("matchesWon"),
-            "winPct": get_stat("winPercentage"),
-            "kills": get_stat("kills"),
-            "deaths": get_stat("deaths"),
-            "kdRatio": get_stat("kdRatio"),
-        }
-        rows.append(row)
-
-    return pd.DataFrame(rows)
+    if not maps_json:
+        return pl.DataFrame()
+
+    return _entries_to_df(maps_json).select(
+        pl.lit(player_name).alias("player"),
+        pl.coalesce(
+            pl.col("metadata").struct.field("mapName"), pl.col("attributes").struct.field("map"), pl.lit("Unknown")
+        ).alias("mapName"),
+        *_stats_exprs(),
+    )
 
 
 def parse_operators_to_df(ops_json, player_name):
     """
-    Converte operators.json em DataFrame, extraindo para cada operador:
+    Converte operators.json em DataFrame (Polars), extraindo para cada operador:
       - operatorName, side (attacker/defender), matchesPlayed, matchesWon, winPct, kills, deaths, kdRatio
 
     Filtra qualquer operador cujo nome seja "Unknown" (ou vazio).
     Retorna um DataFrame com colunas:
       [player, operatorName, side, matchesPlayed, matchesWon, winPct, kills, deaths, kdRatio]
     """
-    rows = []
-    for entry in ops_json:
-        metadata = entry.get("metadata", {})
-        attributes = entry.get("attributes", {})
-        stats = entry.get("stats", {})
-
-        op_name = metadata.get("operatorName", attributes.get("operator", "")).strip()
-        side = attributes.get("side", "all")  # "attacker" ou "defender"
-
-        # === FILTRO: descartar se op_name estiver vazio ou for apenas "Unknown" ===
-        if not op_name or op_name.lower() == "unknown":
-            continue
+    if not ops_json:
+        return pl.DataFrame()
 
-        def get_stat(key):
-            sub = stats.get(key)
-            return sub.get("value") if (sub and sub.get("value") is not None) else 0
-
-        row = {
-            "player": player_name,
-            "operatorName": op_name,
-            "side": side,
-            "matchesPlayed": get_stat("matchesPlayed"),
-            "matchesWon": get_stat("matchesWon"),
-            "winPct": get_stat("winPercentage"),
-            "kills": get_stat("kills"),
-            "deaths": get_stat("deaths"),
-            "kdRatio": get_stat("kdRatio"),
-        }
-        rows.append(row)
+    df = _entries_to_df(ops_json).select(
+        pl.lit(player_name).alias("player"),
+        pl.coalesce(
+            pl.col("metadata").struct.field("operatorName"), pl.col("attributes").struct.field("operator"), pl.lit("")
+        )
+        .str.strip_chars()
+        .alias("operatorName"),
+        pl.col("attributes").struct.field("side").fill_null("all").alias("side"),  # "attacker" ou "defender"
+        *_stats_exprs(),
+    )
 
-    return pd.DataFrame(rows)
+    # === FILTRO: descartar se op_name estiver vazio ou for apenas "Unknown" ===
+    return df.filter(pl.col("operatorName").ne("") & pl.col("operatorName").str.to_lowercase().ne("unknown"))
 
 
 # ------------------------------------------------------------
@@ -192,33 +184,54 @@ def extract_playstyles(overview_json):
 
     Retorna uma lista de tuplas [(nome_do_playstyle, usage_percent), ...].
     """
-    segmento_overview = None
-    for seg in overview_json.get("segments", []):
-        if seg.get("type") == "overview":
-            segmento_overview = seg
-            break
-
+    segmento_overview = next(
+        (seg for seg in overview_json.get("segments", ()) if seg.get("type") == "overview"), None
+    )
     if segmento_overview is None:
         return []
 
     stats = segmento_overview.get("stats", {})
-    playstyles = []
+    playstyles = [
+        (entry.get("displayName", ""), entry.get("metadata", {}).get("usage", {}).get("value", 0))
+        for key, entry in stats.items()
+        if key.startswith("playstyle")
+    ]
 
-    for key, entry in stats.items():
-        if key.startswith("playstyle"):
-            display_name = entry.get("displayName", "")
-            metadata = entry.get("metadata", {})
-            usage = metadata.get("usage", {})
-            percent = usage.get("value", 0)
-            playstyles.append((display_name, percent))
-
-    playstyles.sort(key=lambda x: x[1], reverse=True)
+    playstyles.sort(key=itemgetter(1), reverse=True)
     return playstyles  # lista de tuplas (playstyle, usage_percent)
 
 
+@st.cache_data
+def load_player_playstyles(player_dir):
+    """
+    Versão em cache de extract_playstyles para um diretório de jogador. Lê apenas o
+    overview.json (maps/operators não são tocados) e só a lista de playstyles fica no
+    cache, não o JSON inteiro.
+
+    Retorna a lista de extract_playstyles, ou None se o overview.json não existir.
+    """
+    overview_path = os.path.join(player_dir, "overview.json")
+    if not os.path.isfile(overview_path):
+        return None
+    return extract_playstyles(_read_json(overview_path))
+
+
 # ------------------------------------------------------------
 # 5) Funções de cálculo/agregação
 # ------------------------------------------------------------
+def _safe_ratio(num, den):
+    """
+    Divide num / den elemento a elemento (arrays NumPy) num único loop em C,
+    retornando 0 onde den == 0.
+    """
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    out = np.zeros_like(num)
+    np.divide(num, den, out=out, where=den > 0)
+    return out
+
+
+@st.cache_data(show_spinner=False)
 def compute_best_worst_maps(maps_df_agg, min_map_matches):
     """
     Recebe um DataFrame agregado de mapas e o mínimo de partidas para considerar:
@@ -227,7 +240,7 @@ def compute_best_worst_maps(maps_df_agg, min_map_matches):
     Retorna dois DataFrames (melhores_maps, piores_maps),
     ordenados por winPct desc e winPct asc, filtrados por matchesPlayed >= min_map_matches.
     """
-    df = maps_df_agg[maps_df_agg["matchesPlayed"] >= min_map_matches].copy()
+    df = maps_df_agg[maps_df_agg["matchesPlayed"] >= min_map_matches]  # sem cópia: uso somente leitura
     if df.empty:
         return pd.DataFrame(), pd.DataFrame()
 
@@ -236,6 +249,7 @@ def compute_best_worst_maps(maps_df_agg, min_map_matches):
     return melhores, piores
 
 
+@st.cache_data(show_spinner=False)
 def compute_side_performance(ops_df_agg):
     """
     Recebe DataFrame de operadores agregados por equipe.
@@ -244,7 +258,7 @@ def compute_side_performance(ops_df_agg):
 
     Retorna DataFrame colunas: [side, matchesPlayed, matchesWon, matchesLost, winPctSide]
     """
-    grouped = ops_df_agg.groupby("side").agg(
+    grouped = ops_df_agg.groupby("side", observed=True).agg(
         {
             "matchesPlayed": "sum",
             "matchesWon": "sum",
@@ -252,13 +266,34 @@ def compute_side_performance(ops_df_agg):
     ).reset_index()
 
     grouped["matchesLost"] = grouped["matchesPlayed"] - grouped["matchesWon"]
-    grouped["winPctSide"] = grouped.apply(
-        lambda row: (row["matchesWon"] / row["matchesPlayed"] * 100) if row["matchesPlayed"] > 0 else 0,
-        axis=1,
-    )
+    grouped["winPctSide"] = _safe_ratio(grouped["matchesWon"].to_numpy(), grouped["matchesPlayed"].to_numpy()) * 100
     return grouped.sort_values("matchesPlayed", ascending=False)
 
 
+def _top_n_by(df, col, n):
+    """
+    Top n linhas por `col` (desc), como sort_values(...).head(n).reset_index(drop=True), mas
+    seleciona as n maiores com np.partition (O(N)) e só ordena essas n.
+
+    Nulos (ex: killsPerMatch com matchesPlayed == 0) ficam por último, como no sort_values,
+    e empates no limite do corte mantêm as primeiras linhas na ordem original.
+    """
+    vals = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    nulos = np.isnan(vals)
+    if len(df) - nulos.sum() <= n:
+        # menos de n valores válidos: a ordenação completa já devolve os nulos por último
+        return df.sort_values(col, ascending=False, kind="stable").head(n).reset_index(drop=True)
+
+    vals = np.where(nulos, -np.inf, vals)
+    corte = np.partition(vals, len(vals) - n)[len(vals) - n]  # n-ésimo maior valor
+    acima = np.flatnonzero(vals > corte)
+    empatados = np.flatnonzero(vals == corte)[: n - len(acima)]
+    idx = np.sort(np.concatenate((acima, empatados)))
+    # ordenação estável sobre as linhas em ordem original: empates mantêm a ordem das linhas
+    return df.iloc[idx].sort_values(col, ascending=False, kind="stable").reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False)
 def compute_most_played_operators(ops_df_agg_player, min_operator_matches, top_n=10):
     """
     Recebe DataFrame de operadores agregado por jogador e o mínimo de partidas para considerar.
@@ -267,30 +302,310 @@ def compute_most_played_operators(ops_df_agg_player, min_operator_matches, top_n
       - maior_win:    top_n por winPct (matchesPlayed >= min_operator_matches)
       - maior_kpm:    top_n por killsPerMatch (matchesPlayed >= min_operator_matches)
     """
-    df = ops_df_agg_player[ops_df_agg_player["matchesPlayed"] >= min_operator_matches].copy()
+    # killsPerMatch vem calculado da agregação (_with_derived_metrics)
+    df = ops_df_agg_player[ops_df_agg_player["matchesPlayed"] >= min_operator_matches]
     if df.empty:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
 
-    mais_jogados = df.sort_values("matchesPlayed", ascending=False).head(top_n).reset_index(drop=True)
-    maior_win = df.sort_values("winPct", ascending=False).head(top_n).reset_index(drop=True)
-    df["killsPerMatch"] = df["kills"] / df["matchesPlayed"].replace(0, pd.NA)
-    maior_kpm = df.sort_values("killsPerMatch", ascending=False).head(top_n).reset_index(drop=True)
+    mais_jogados = _top_n_by(df, "matchesPlayed", top_n)
+    maior_win = _top_n_by(df, "winPct", top_n)
+    maior_kpm = _top_n_by(df, "killsPerMatch", top_n)
 
     return mais_jogados, maior_win, maior_kpm
 
 
+# Colunas numéricas dos DataFrames agregados (mapas e operadores)
+COUNT_COLUMNS = ["matchesPlayed", "matchesWon", "matchesLost", "kills", "deaths"]
+RATE_COLUMNS = ["winPct", "kdRatio", "killsPerMatch"]
+
+
+def _with_derived_metrics(df):
+    """
+    Recebe um DataFrame (Polars) agregado com matchesPlayed, matchesWon, kills e deaths
+    e acrescenta, numa única passada de with_columns:
+      matchesLost, winPct, kdRatio, killsPerMatch
+    """
+    return df.with_columns(
+        (pl.col("matchesPlayed") - pl.col("matchesWon")).alias("matchesLost"),
+        pl.when(pl.col("matchesPlayed") > 0)
+        .then(pl.col("matchesWon") / pl.col("matchesPlayed") * 100)
+        .otherwise(0)
+        .alias("winPct"),
+        pl.when(pl.col("deaths") > 0).then(pl.col("kills") / pl.col("deaths")).otherwise(0).alias("kdRatio"),
+        pl.when(pl.col("matchesPlayed") > 0)
+        .then(pl.col("kills") / pl.col("matchesPlayed"))
+        .otherwise(None)
+        .alias("killsPerMatch"),
+    ).with_columns(
+        # Contagens e taxas cabem folgadamente em 32 bits: metade da largura das colunas
+        pl.col(COUNT_COLUMNS).cast(pl.UInt32),
+        pl.col(RATE_COLUMNS).cast(pl.Float32),
+    )
+
+
+# Versão do formato dos caches Parquet: incrementar sempre que algum parse_*_to_df mudar
+# o schema/conteúdo dos DataFrames, para que caches antigos não sejam reaproveitados
+PARQUET_CACHE_VERSION = 2
+
+
+def _parse_with_parquet_cache(json_path, parse, player_name):
+    """
+    Retorna parse(json, player_name) para o arquivo json_path, usando um cache Parquet
+    (zstd) ao lado do JSON: "<pasta>/_cache_<nome>_v<PARQUET_CACHE_VERSION>.parquet".
+
+    O cache só é usado se for mais novo que o JSON (mtime) e puder ser lido; caso
+    contrário (ausente, antigo ou corrompido) o JSON é parseado e o Parquet regravado.
+    A gravação vai para um arquivo temporário na mesma pasta e só então é movida
+    (os.replace, atômico) para o caminho final, então nunca fica um Parquet pela metade.
+
+    A coluna "player" não é gravada: ela vem de player_name (nome da pasta), que pode
+    mudar sem o JSON mudar (pasta renomeada ou copiada), então é recolocada na leitura.
+    Retorna None se o JSON não existir.
+    """
+    if not os.path.isfile(json_path):
+        return None
+
+    pasta = os.path.dirname(json_path)
+    nome = os.path.splitext(os.path.basename(json_path))[0]
+    cache_path = os.path.join(pasta, f"_cache_{nome}_v{PARQUET_CACHE_VERSION}.parquet")
+
+    if os.path.isfile(cache_path) and os.path.getmtime(json_path) <= os.path.getmtime(cache_path):
+        try:
+            cached = pl.read_parquet(cache_path)
+            return cached.select(pl.lit(player_name).alias("player"), pl.all()) if cached.width else cached
+        except (OSError, pl.exceptions.PolarsError):
+            pass  # cache ilegível (gravação interrompida, disco etc.): refaz a partir do JSON
+
+    df = parse(_read_json(json_path), player_name)
+    # Nome único por processo/thread; o modo 0o644 passa pelo umask, como nos JSONs ao lado
+    tmp_path = f"{cache_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    criado = False
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        criado = True
+        with os.fdopen(fd, "wb") as f:
+            df.drop("player", strict=False).write_parquet(f, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except (OSError, pl.exceptions.PolarsError):
+        # pasta sem permissão de escrita: segue sem o cache em disco
+        if criado and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+
+@st.cache_data
+def build_player_frames(player_dir, player_name):
+    """
+    Converte overview.json, maps.json e operators.json de um jogador em DataFrames
+    com os parse_*_to_df.
+
+    Camadas de cache: st.cache_data (memória) -> Parquet em disco, invalidado pelo
+    mtime do JSON (_parse_with_parquet_cache) -> parse do JSON.
+
+    Retorna uma tupla (overview_df, maps_df, ops_df).
+    Qualquer um dos três cujo arquivo não exista retorna None.
+    """
+    return tuple(
+        _parse_with_parquet_cache(os.path.join(player_dir, nome_arquivo), parse, player_name)
+        for nome_arquivo, parse in (
+            ("overview.json", parse_overview_to_df),
+            ("maps.json", parse_maps_to_df),
+            ("operators.json", parse_operators_to_df),
+        )
+    )
+
+
+@st.cache_data
+def build_team_aggregates(base_folder, players):
+    """
+    Recebe a pasta base e uma tupla (hashável, para o cache) com os nomes dos jogadores.
+    Monta os DataFrames de cada jogador (build_player_frames), concatena e agrega por equipe.
+
+    Retorna uma tupla:
+      (overview_df, df_overview_equipe, maps_df_agg, ops_df_agg_team, ops_df_agg_player, arquivos_ausentes)
+    onde arquivos_ausentes é uma lista de (jogador, nome_do_arquivo) não encontrados.
+    Os filtros de mínimo de partidas ficam fora daqui, já que são aplicados depois.
+    """
+    overview_list = []
+    maps_list = []
+    ops_list = []
+    arquivos_ausentes = []
+
+    # Leitura dos arquivos é I/O-bound: carrega os jogadores em paralelo.
+    # As threads herdam o contexto da sessão para que o st.cache_data funcione nelas.
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(players)),
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as executor:
+        frames_por_jogador = executor.map(
+            build_player_frames,
+            [os.path.join(base_folder, player) for player in players],
+            players,
+        )
+
+        for player, (df_over, df_maps, df_ops) in zip(players, frames_por_jogador):
+            for nome_arquivo, df, destino in (
+                ("overview.json", df_over, overview_list),
+                ("maps.json", df_maps, maps_list),
+                ("operators.json", df_ops, ops_list),
+            ):
+                if df is None:
+                    arquivos_ausentes.append((player, nome_arquivo))
+                else:
+                    destino.append(df)
+
+    # rechunk=False: os DataFrames de cada jogador entram como chunks, sem cópia; o group_by
+    # abaixo lê os chunks diretamente e a única materialização é o resultado agregado
+    overview_df = pl.concat(overview_list, how="diagonal_relaxed", rechunk=False) if overview_list else pl.DataFrame()
+    maps_df = pl.concat(maps_list, how="diagonal_relaxed", rechunk=False) if maps_list else pl.DataFrame()
+    ops_df = pl.concat(ops_list, how="diagonal_relaxed", rechunk=False) if ops_list else pl.DataFrame()
+
+    # Chaves de agrupamento têm baixa cardinalidade: "category" agrupa pelos códigos inteiros
+    overview_df, maps_df, ops_df = (
+        df.with_columns(
+            pl.col(col).cast(pl.Categorical)
+            for col in ("player", "mapName", "operatorName", "side")
+            if col in df.columns
+        )
+        for df in (overview_df, maps_df, ops_df)
+    )
+
+    somas = [pl.col(c).sum() for c in ("matchesPlayed", "matchesWon", "kills", "deaths")]
+
+    # Overview agregado da equipe
+    if not overview_df.is_empty():
+        df_overview_equipe = overview_df.select(
+            pl.lit("Equipe").alias("player"),
+            *(pl.col(c).sum() for c in ("matchesPlayed", "matchesWon", "matchesLost", "kills", "deaths")),
+        ).with_columns(
+            pl.when(pl.col("matchesPlayed") > 0)
+            .then(pl.col("matchesWon") / pl.col("matchesPlayed") * 100)
+            .otherwise(0)
+            .alias("winPct"),
+            pl.when(pl.col("deaths") > 0).then(pl.col("kills") / pl.col("deaths")).otherwise(0).alias("kdRatio"),
+        )
+    else:
+        df_overview_equipe = pl.DataFrame()
+
+    # Maps agregado
+    if not maps_df.is_empty():
+        maps_df_agg = _with_derived_metrics(maps_df.group_by("mapName").agg(somas).sort("mapName"))
+    else:
+        maps_df_agg = pl.DataFrame()
+
+    # Operadores agregado (e também separado por jogador)
+    if not ops_df.is_empty():
+        # **Agregado POR JOGADOR** (para usar na aba de Operadores e nos Insights)
+        ops_df_agg_player = ops_df.group_by(["player", "operatorName", "side"]).agg(somas)
+        ops_df_agg_player = _with_derived_metrics(ops_df_agg_player.sort(["player", "operatorName", "side"]))
+
+        # **Agregado da equipe**: derivado do agregado por jogador (somando sobre "player"),
+        # evitando um segundo group_by sobre o DataFrame bruto
+        ops_df_agg_team = ops_df_agg_player.group_by(["operatorName", "side"]).agg(somas)
+        ops_df_agg_team = _with_derived_metrics(ops_df_agg_team.sort(["operatorName", "side"]))
+    else:
+        ops_df_agg_team = pl.DataFrame()
+        ops_df_agg_player = pl.DataFrame()
+
+    # Fronteira com a UI (Streamlit/Altair/ReportLab): a partir daqui tudo é pandas
+    return (
+        overview_df.to_pandas(),
+        df_overview_equipe.to_pandas(),
+        maps_df_agg.to_pandas(),
+        ops_df_agg_team.to_pandas(),
+        ops_df_agg_player.to_pandas(),
+        arquivos_ausentes,
+    )
+
+
 # ------------------------------------------------------------
 # 6) Função para gerar PDF com as análises (usando ReportLab + Matplotlib)
 # ------------------------------------------------------------
+@st.cache_resource
+def _pdf_styles():
+    """
+    Retorna um dict com os ParagraphStyle do PDF (somente leitura, compartilhado pelo processo).
+    """
+    base = getSampleStyleSheet()
+    return {
+        "titulo": ParagraphStyle(
+            "titulo", parent=base["Heading1"], alignment=TA_LEFT, fontSize=16, spaceAfter=12
+        ),
+        "subtitulo": ParagraphStyle(
+            "subtitulo", parent=base["Heading2"], alignment=TA_LEFT, fontSize=12, spaceAfter=8
+        ),
+        "normal": ParagraphStyle(
+            "normal", parent=base["BodyText"], fontSize=10, spaceAfter=6
+        ),
+        "tabela_cabecalho": ParagraphStyle(
+            "tabela_cabecalho", parent=base["Heading4"], fontSize=10, alignment=TA_LEFT, spaceAfter=4
+        ),
+    }
+
+
+# PNG dos gráficos embutidos no PDF: 100 DPI basta para o tamanho em que são exibidos e
+# compress_level=1 (ainda sem perdas) evita o custo do zlib no nível padrão. Cada gráfico
+# mantém seu próprio BytesIO: o Image do ReportLab só lê o buffer no doc.build, então
+# reaproveitar um único buffer sobrescreveria os anteriores.
+PDF_CHART_SAVEFIG_KWARGS = {"format": "PNG", "dpi": 100, "pil_kwargs": {"compress_level": 1}}
+
+
+def _chart_image(fig, width, height):
+    """
+    Codifica a figura Matplotlib em PNG uma única vez e retorna o Image do ReportLab.
+
+    O Image cria um único ImageReader sobre o buffer já no construtor e o reutiliza em
+    todas as passadas de layout do doc.build, então a imagem não é decodificada de novo.
+    """
+    buf = io.BytesIO()
+    fig.tight_layout()
+    fig.savefig(buf, **PDF_CHART_SAVEFIG_KWARGS)
+    buf.seek(0)
+    return Image(buf, width=width, height=height)
+
+
+def _known_values_mask(col):
+    """
+    Máscara booleana das linhas cujo valor não é "unknown" (em qualquer caixa) nem vazio.
+
+    Para colunas "category" o teste roda uma vez sobre as categorias (poucas dezenas) e é
+    mapeado para as linhas pelos códigos, sem criar uma string minúscula por linha.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        desconhecidas = col.cat.categories.str.lower().isin(["unknown", ""])
+        codes = col.cat.codes.to_numpy()
+        # código -1 (valor nulo) não é "unknown": mantém a linha, como no filtro por string
+        return pd.Series(~np.where(codes >= 0, desconhecidas[codes], False), index=col.index)
+
+    return ~col.str.lower().isin(["unknown", ""])
+
+
+def _overview_text(player, row):
+    """
+    Texto (mini-HTML do ReportLab) com as estatísticas gerais de um jogador no PDF.
+    """
+    return (
+        f"<b>{player}</b>: "
+        f"Partidas Jogadas: {int(row.get('matchesPlayed', 0))}, "
+        f"Vitórias: {int(row.get('matchesWon', 0))}, "
+        f"Win%: {row.get('winPct', 0):.2f}%, "
+        f"Kills: {int(row.get('kills', 0))}, "
+        f"Deaths: {int(row.get('deaths', 0))}, "
+        f"K/D: {row.get('kdRatio', 0):.2f}"
+    )
+
+
 def create_pdf_report(
     jogadores: list[str],
-    overview_raw_by_player: dict[str, pd.DataFrame],
+    overview_df: pd.DataFrame,
     maps_df_agg: pd.DataFrame,
     ops_df_agg_player: pd.DataFrame,
     ops_df_agg_team: pd.DataFrame,
     sides_df_agg: pd.DataFrame,
     min_operator_matches: int,
     min_map_matches: int,
+    estilos: dict[str, ParagraphStyle],
 ) -> bytes:
     """
     Gera um relatório PDF com:
@@ -299,6 +614,9 @@ def create_pdf_report(
       - Melhor e pior lado (ATK x DEF) da equipe
       - Estatísticas gerais de equipe (win%, K/D, etc.)
       - Gráficos embutidos: desempenho de operadores e de mapas (com anotações)
+
+    `estilos` é o dict de _pdf_styles(), resolvido pelo chamador: esta função roda numa
+    thread do pool do PDF, sem ScriptRunContext, então não chama APIs do Streamlit.
     """
 
     # --------------------------------------------------------------------------------
@@ -314,66 +632,44 @@ def create_pdf_report(
         bottomMargin=24,
     )
 
-    styles = getSampleStyleSheet()
-    estilos = {
-        "titulo": ParagraphStyle(
-            "titulo", parent=styles["Heading1"], alignment=TA_LEFT, fontSize=16, spaceAfter=12
-        ),
-        "subtitulo": ParagraphStyle(
-            "subtitulo", parent=styles["Heading2"], alignment=TA_LEFT, fontSize=12, spaceAfter=8
-        ),
-        "normal": ParagraphStyle(
-            "normal", parent=styles["BodyText"], fontSize=10, spaceAfter=6
-        ),
-        "tabela_cabecalho": ParagraphStyle(
-            "tabela_cabecalho", parent=styles["Heading4"], fontSize=10, alignment=TA_LEFT, spaceAfter=4
-        ),
-    }
-
     elements = []
 
     # --------------------------------------------------------------------------------
     # 2) Limpeza / filtros gerais
     # --------------------------------------------------------------------------------
-    # 2.1 Remover qualquer linha com "unknown" em operador ou mapa:
+    # 2.1 Remover qualquer linha com "unknown" (ou vazia) em operador ou mapa:
     if "operatorName" in ops_df_agg_player.columns:
-        ops_df_agg_player = ops_df_agg_player[
-            ops_df_agg_player["operatorName"].str.lower() != "unknown"
-        ].copy()
+        ops_df_agg_player = ops_df_agg_player[_known_values_mask(ops_df_agg_player["operatorName"])]
 
     if "mapName" in maps_df_agg.columns:
-        maps_df_agg = maps_df_agg[maps_df_agg["mapName"].str.lower() != "unknown"].copy()
+        maps_df_agg = maps_df_agg[_known_values_mask(maps_df_agg["mapName"])]
 
     # 2.2 Filtrar operadores abaixo de min_operator_matches
     ops_df_agg_player = ops_df_agg_player[
         ops_df_agg_player["matchesPlayed"] >= min_operator_matches
-    ].copy()
+    ]
 
     # 2.3 Filtrar mapas abaixo de min_map_matches
-    maps_df_agg = maps_df_agg[maps_df_agg["matchesPlayed"] >= min_map_matches].copy()
+    maps_df_agg = maps_df_agg[maps_df_agg["matchesPlayed"] >= min_map_matches]
 
     # 2.4 (os lados não têm “player”; é agregado por equipe.
     #     Caso haja “unknown” na coluna “side”, eliminamos também:)
     if "side" in sides_df_agg.columns:
-        sides_df_agg = sides_df_agg[sides_df_agg["side"].str.lower() != "unknown"].copy()
+        sides_df_agg = sides_df_agg[_known_values_mask(sides_df_agg["side"])]
 
     # --------------------------------------------------------------------------------
     # 3) Título geral
     # --------------------------------------------------------------------------------
-    elements.append(Paragraph("Relatório Detalhado de R6 Siege", estilos["titulo"]))
-    elements.append(Spacer(1, 12))
+    elements.extend([Paragraph("Relatório Detalhado de R6 Siege", estilos["titulo"]), Spacer(1, 12)])
 
     # --------------------------------------------------------------------------------
     # 4) Estatísticas da equipe: melhores/piores mapas e lados
     # --------------------------------------------------------------------------------
     # 4.1 Melhores e piores mapas (toda equipe):
     if not maps_df_agg.empty:
-        # Ordenar por winPct desc para melhores, asc para piores
-        maps_sorted = maps_df_agg.sort_values("winPct", ascending=False).reset_index(drop=True)
-
-        # Melhor mapa (primeira linha), pior mapa (última linha)
-        melhor_mapa = maps_sorted.iloc[0]
-        pior_mapa = maps_sorted.iloc[-1]
+        # Melhor e pior mapa por winPct (idxmax/idxmin: uma passada, sem ordenar)
+        melhor_mapa = maps_df_agg.loc[maps_df_agg["winPct"].idxmax()]
+        pior_mapa = maps_df_agg.loc[maps_df_agg["winPct"].idxmin()]
 
         elements.append(Paragraph("📊 Melhores e Piores Mapas (Equipe)", estilos["subtitulo"]))
         texto_mapas = (
@@ -384,14 +680,12 @@ def create_pdf_report(
             f"(Partidas: {pior_mapa['matchesPlayed']}, Win%: {pior_mapa['winPct']:.2f}%, "
             f"K/D: {pior_mapa.get('kdRatio', 0):.2f})"
         )
-        elements.append(Paragraph(texto_mapas, estilos["normal"]))
-        elements.append(Spacer(1, 6))
+        elements.extend([Paragraph(texto_mapas, estilos["normal"]), Spacer(1, 6)])
 
     # 4.2 Melhor e pior lado (ATK x DEF, para toda equipe):
     if not sides_df_agg.empty:
-        sides_sorted = sides_df_agg.sort_values("winPctSide", ascending=False).reset_index(drop=True)
-        melhor_lado = sides_sorted.iloc[0]
-        pior_lado = sides_sorted.iloc[-1]
+        melhor_lado = sides_df_agg.loc[sides_df_agg["winPctSide"].idxmax()]
+        pior_lado = sides_df_agg.loc[sides_df_agg["winPctSide"].idxmin()]
 
         elements.append(Paragraph("⚔️ Melhor e Pior Lado (Equipe)", estilos["subtitulo"]))
         texto_lados = (
@@ -400,64 +694,58 @@ def create_pdf_report(
             f"<b>Pior Lado:</b> {pior_lado['side']} "
             f"(Partidas: {pior_lado['matchesPlayed']}, Win%: {pior_lado['winPctSide']:.2f}%)"
         )
-        elements.append(Paragraph(texto_lados, estilos["normal"]))
-        elements.append(Spacer(1, 12))
+        elements.extend([Paragraph(texto_lados, estilos["normal"]), Spacer(1, 12)])
 
     # --------------------------------------------------------------------------------
     # 5) Para cada jogador, mostrar insights de operadores
     # --------------------------------------------------------------------------------
+    # Uma única figura é reaproveitada (ax_op.clear()) para os gráficos de todos os jogadores
+    fig_op = Figure(figsize=(5, 3))
+    ax_op = fig_op.subplots()
+
     for player in jogadores:
         elements.append(Paragraph(f"🎯 Insights de Operadores: {player}", estilos["subtitulo"]))
 
         # 5.1 Filtrar só linhas deste jogador:
-        df_ops_jog = ops_df_agg_player[ops_df_agg_player["player"] == player].copy()
+        df_ops_jog = ops_df_agg_player[ops_df_agg_player["player"] == player]
         if df_ops_jog.empty:
-            elements.append(Paragraph("Sem dados suficientes de operadores para este jogador.", estilos["normal"]))
-            elements.append(Spacer(1, 8))
+            elements.extend(
+                [Paragraph("Sem dados suficientes de operadores para este jogador.", estilos["normal"]), Spacer(1, 8)]
+            )
             continue
 
         # 5.2 Encontrar top e bottom operators (por winPct)
-        df_ops_sorted = df_ops_jog.sort_values("winPct", ascending=False).reset_index(drop=True)
-        top_op = df_ops_sorted.iloc[0]
-        bot_op = df_ops_sorted.iloc[-1]
+        top_op = df_ops_jog.loc[df_ops_jog["winPct"].idxmax()]
+        bot_op = df_ops_jog.loc[df_ops_jog["winPct"].idxmin()]
 
         texto_ops = (
             f"<b>Top Operator:</b> {top_op['operatorName']} "
             f"(Partidas: {top_op['matchesPlayed']}, Win%: {top_op['winPct']:.2f}%, "
-            f"Kills/Match: {top_op['kills'] / top_op['matchesPlayed']:.2f})<br/>"
+            f"Kills/Match: {top_op['killsPerMatch']:.2f})<br/>"
             f"<b>Worst Operator:</b> {bot_op['operatorName']} "
             f"(Partidas: {bot_op['matchesPlayed']}, Win%: {bot_op['winPct']:.2f}%, "
-            f"Kills/Match: {bot_op['kills'] / bot_op['matchesPlayed']:.2f})"
+            f"Kills/Match: {bot_op['killsPerMatch']:.2f})"
         )
-        elements.append(Paragraph(texto_ops, estilos["normal"]))
-        elements.append(Spacer(1, 12))
+        elements.extend([Paragraph(texto_ops, estilos["normal"]), Spacer(1, 12)])
 
         # 5.3 Gráfico de operadores do jogador: scatter de (matchesPlayed vs winPct)
-        fig_op = plt.figure(figsize=(5, 3))
-        ax_op = fig_op.add_subplot(111)
+        ax_op.clear()
         ax_op.scatter(df_ops_jog["matchesPlayed"], df_ops_jog["winPct"], s=40, c="tab:blue", alpha=0.7)
         ax_op.set_title(f"Desempenho de Operadores – {player}")
         ax_op.set_xlabel("Partidas Jogadas")
         ax_op.set_ylabel("Win %")
         ax_op.grid(alpha=0.3)
 
-        for _, row in df_ops_jog.iterrows():
-            ax_op.annotate(
-                row["operatorName"],
-                xy=(row["matchesPlayed"], row["winPct"]),
-                xytext=(3, 3),
-                textcoords="offset points",
-                fontsize=6,
-            )
-
-        buf_op = io.BytesIO()
-        fig_op.tight_layout()
-        fig_op.savefig(buf_op, format="PNG", dpi=150)
-        plt.close(fig_op)
-        buf_op.seek(0)
+        # Rótulos com ax.text, deslocados 3pt do ponto
+        deslocamento = offset_copy(ax_op.transData, fig=fig_op, x=3, y=3, units="points")
+        for x, y, nome in zip(
+            df_ops_jog["matchesPlayed"].to_numpy(),
+            df_ops_jog["winPct"].to_numpy(),
+            df_ops_jog["operatorName"].to_numpy(),
+        ):
+            ax_op.text(x, y, nome, fontsize=6, transform=deslocamento)
 
-        elements.append(Image(buf_op, width=400, height=240))
-        elements.append(Spacer(1, 12))
+        elements.extend([_chart_image(fig_op, width=400, height=240), Spacer(1, 12)])
 
     # --------------------------------------------------------------------------------
     # 6) Gráfico conjunto de mapas de equipe
@@ -465,30 +753,23 @@ def create_pdf_report(
     if not maps_df_agg.empty:
         elements.append(Paragraph("🗺️ Desempenho de Mapas (Equipe)", estilos["subtitulo"]))
 
-        fig_map = plt.figure(figsize=(6, 3.5))
-        ax_map = fig_map.add_subplot(111)
+        fig_map = Figure(figsize=(6, 3.5))
+        ax_map = fig_map.subplots()
         ax_map.scatter(maps_df_agg["matchesPlayed"], maps_df_agg["winPct"], s=50, c="tab:green", alpha=0.7)
         ax_map.set_title("Desempenho de Mapas – Equipe")
         ax_map.set_xlabel("Partidas Jogadas")
         ax_map.set_ylabel("Win %")
         ax_map.grid(alpha=0.3)
 
-        for _, row in maps_df_agg.iterrows():
-            ax_map.annotate(
-                row["mapName"],
-                xy=(row["matchesPlayed"], row["winPct"]),
-                xytext=(3, 3),
-                textcoords="offset points",
-                fontsize=7,
-            )
-
-        buf_map = io.BytesIO()
-        fig_map.tight_layout()
-        fig_map.savefig(buf_map, format="PNG", dpi=150)
-        plt.close(fig_map)
-        buf_map.seek(0)
+        deslocamento = offset_copy(ax_map.transData, fig=fig_map, x=3, y=3, units="points")
+        for x, y, nome in zip(
+            maps_df_agg["matchesPlayed"].to_numpy(),
+            maps_df_agg["winPct"].to_numpy(),
+            maps_df_agg["mapName"].to_numpy(),
+        ):
+            ax_map.text(x, y, nome, fontsize=7, transform=deslocamento)
 
-        elements.append(Image(buf_map, width=500, height=280))
+        elements.append(_chart_image(fig_map, width=500, height=280))
         elements.append(Spacer(1, 12))
 
     # --------------------------------------------------------------------------------
@@ -523,32 +804,20 @@ def create_pdf_report(
                 ]
             )
         )
-        elements.append(t)
-        elements.append(Spacer(1, 12))
+        elements.extend([t, Spacer(1, 12)])
 
     # --------------------------------------------------------------------------------
-    # 8) Insira estatísticas gerais da equipe (por player) a partir de overview_raw_by_player
+    # 8) Insira estatísticas gerais da equipe (por player) a partir do overview_df já parseado
     # --------------------------------------------------------------------------------
     elements.append(Paragraph("📈 Estatísticas Gerais por Jogador", estilos["subtitulo"]))
-    for player, df_over_json in overview_raw_by_player.items():
-        # Parse novamente para DataFrame só para garantir a estrutura.
-        df_over_df = parse_overview_to_df(df_over_json, player)
-        if df_over_df.empty:
+    overview_by_player = overview_df.set_index("player") if "player" in overview_df.columns else overview_df
+    for player in jogadores:
+        if player in overview_by_player.index:
+            elements.extend(
+                [Paragraph(_overview_text(player, overview_by_player.loc[player]), estilos["normal"]), Spacer(1, 6)]
+            )
+        else:
             elements.append(Paragraph(f"{player}: Sem dados gerais disponíveis.", estilos["normal"]))
-            continue
-
-        row = df_over_df.iloc[0]
-        tex = (
-            f"<b>{player}</b>: "
-            f"Partidas Jogadas: {row.get('matchesPlayed', 0)}, "
-            f"Vitórias: {row.get('matchesWon', 0)}, "
-            f"Win%: {row.get('winPct', 0):.2f}%, "
-            f"Kills: {row.get('kills', 0)}, "
-            f"Deaths: {row.get('deaths', 0)}, "
-            f"K/D: {row.get('kdRatio', 0):.2f}"
-        )
-        elements.append(Paragraph(tex, estilos["normal"]))
-        elements.append(Spacer(1, 6))
 
     # --------------------------------------------------------------------------------
     # 9) Monta e retorna o PDF (tentando ficar em uma página, só quebrando se realmente necessário)
@@ -559,9 +828,550 @@ def create_pdf_report(
     return pdf_bytes
 
 
+@st.cache_resource
+def _pdf_executor():
+    """
+    Retorna o ThreadPoolExecutor (compartilhado pelo processo) que gera os PDFs.
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-report")
+
+
+# Cada PDF tem 100–300 KB: só as combinações mais recentes ficam em memória
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_pdf_report(
+    jogadores: list[str],
+    overview_df: pd.DataFrame,
+    maps_df_agg: pd.DataFrame,
+    ops_df_agg_player: pd.DataFrame,
+    ops_df_agg_team: pd.DataFrame,
+    sides_df_agg: pd.DataFrame,
+    min_operator_matches: int,
+    min_map_matches: int,
+) -> bytes:
+    """
+    Executa create_pdf_report no _pdf_executor() e guarda os bytes em cache:
+    clicar de novo no botão sem mudar jogadores, dados ou mínimos não regenera o PDF.
+    Os estilos (st.cache_resource) são resolvidos aqui, na thread do script.
+    """
+    estilos = _pdf_styles()
+    return _pdf_executor().submit(
+        create_pdf_report,
+        jogadores,
+        overview_df,
+        maps_df_agg,
+        ops_df_agg_player,
+        ops_df_agg_team,
+        sides_df_agg,
+        min_operator_matches,
+        min_map_matches,
+        estilos,
+    ).result()
+
+
 # ------------------------------------------------------------
 # 7) Função principal de UI (Streamlit)
 # ------------------------------------------------------------
+# DataFrame vazio devolvido para jogadores sem operadores (somente leitura)
+_EMPTY_DF = pd.DataFrame()
+
+# Colunas exibidas em cada tabela do dashboard
+OVERVIEW_COLS = ["player", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kills", "deaths", "kdRatio"]
+MAP_COLS = ["mapName", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kdRatio"]
+SIDE_COLS = ["side", "matchesPlayed", "matchesWon", "matchesLost", "winPctSide"]
+OP_TOP_COLS = ["operatorName", "side", "matchesPlayed", "winPct", "kdRatio"]
+OP_KPM_COLS = ["operatorName", "side", "matchesPlayed", "killsPerMatch", "kdRatio"]
+PLAYER_BEST_COLS = ["player", "side", "operatorName", "matchesPlayed", "winPct", "killsPerMatch"]
+PLAYER_SIDE_TOP_COLS = ["player", "operatorName", "matchesPlayed", "winPct", "killsPerMatch", "kdRatio"]
+
+# Especificações Vega-Lite dos gráficos (dicts estáticos; só os dados mudam a cada execução)
+VEGA_LITE_SCHEMA = "https://vega.github.io/schema/vega-lite/v5.json"
+
+# Vitórias x Derrotas em formato longo feito no próprio Vega-Lite (fold), a partir
+# das colunas matchesWon/matchesLost do DataFrame largo (sem melt no Python)
+WIN_LOSS_FOLD_TRANSFORM = [
+    {"fold": ["matchesWon", "matchesLost"], "as": ["Resultado", "Contagem"]},
+    {"calculate": "datum.Resultado === 'matchesWon' ? 'Vitórias' : 'Derrotas'", "as": "Resultado"},
+]
+
+# Encodings compartilhados entre os gráficos (construídos uma única vez no import)
+WIN_LOSS_COLOR_ENCODING = {
+    "field": "Resultado",
+    "type": "nominal",
+    "title": "Resultado",
+    "scale": {"domain": ["Vitórias", "Derrotas"], "scheme": "set1"},
+}
+WIN_LOSS_COUNT_ENCODING = {"field": "Contagem", "type": "quantitative", "title": "Partidas"}
+WIN_LOSS_TOOLTIP = [
+    {"field": "Resultado", "type": "nominal"},
+    {"field": "Contagem", "type": "quantitative"},
+]
+SIDE_X_ENCODING = {"field": "side", "type": "nominal", "title": "Lado"}
+MATCHES_PLAYED_X_ENCODING = {"field": "matchesPlayed", "type": "quantitative", "title": "Partidas Jogadas"}
+WIN_PCT_Y_ENCODING = {"field": "winPct", "type": "quantitative", "title": "Win %"}
+SCATTER_MARK = {"type": "circle", "size": 80, "opacity": 0.7}
+
+MAP_RESULT_CHART_SPEC = {
+    "$schema": VEGA_LITE_SCHEMA,
+    "transform": WIN_LOSS_FOLD_TRANSFORM,
+    "mark": {"type": "bar"},
+    "height": 350,
+    "encoding": {
+        "x": {"field": "mapName", "type": "nominal", "sort": "-y", "title": "Mapa"},
+        "y": WIN_LOSS_COUNT_ENCODING,
+        "color": WIN_LOSS_COLOR_ENCODING,
+        "tooltip": [{"field": "mapName", "type": "nominal"}, *WIN_LOSS_TOOLTIP],
+    },
+}
+
+SIDE_RESULT_CHART_SPEC = {
+    "$schema": VEGA_LITE_SCHEMA,
+    "transform": WIN_LOSS_FOLD_TRANSFORM,
+    "mark": {"type": "bar"},
+    "height": 350,
+    "encoding": {
+        "x": SIDE_X_ENCODING,
+        "y": WIN_LOSS_COUNT_ENCODING,
+        "color": WIN_LOSS_COLOR_ENCODING,
+        "tooltip": [{"field": "side", "type": "nominal"}, *WIN_LOSS_TOOLTIP],
+    },
+}
+
+OPS_RESULT_CHART_SPEC = {
+    "$schema": VEGA_LITE_SCHEMA,
+    "transform": WIN_LOSS_FOLD_TRANSFORM,
+    "mark": {"type": "bar"},
+    "height": 300,
+    "encoding": {
+        "x": {"field": "operatorName", "type": "nominal", "sort": "-y", "title": "Operador"},
+        "y": WIN_LOSS_COUNT_ENCODING,
+        "color": WIN_LOSS_COLOR_ENCODING,
+        "tooltip": [{"field": "operatorName", "type": "nominal"}, *WIN_LOSS_TOOLTIP],
+    },
+}
+
+MAP_SCATTER_CHART_SPEC = {
+    "$schema": VEGA_LITE_SCHEMA,
+    "mark": SCATTER_MARK,
+    "height": 350,
+    "encoding": {
+        "x": MATCHES_PLAYED_X_ENCODING,
+        "y": WIN_PCT_Y_ENCODING,
+        "color": {"field": "winPct", "type": "quantitative", "scale": {"scheme": "viridis"}, "title": "Win %"},
+        "tooltip": [
+            {"field": "mapName", "type": "nominal"},
+            {"field": "matchesPlayed", "type": "quantitative"},
+            {"field": "winPct", "type": "quantitative"},
+            {"field": "kdRatio", "type": "quantitative"},
+        ],
+    },
+}
+
+SIDE_WINPCT_CHART_SPEC = {
+    "$schema": VEGA_LITE_SCHEMA,
+    "mark": {"type": "bar"},
+    "height": 300,
+    "encoding": {
+        "x": SIDE_X_ENCODING,
+        "y": {"field": "winPctSide", "type": "quantitative", "title": "Win %"},
+        "color": {"field": "side", "type": "nominal", "scale": {"domain": ["attacker", "defender"], "scheme": "set2"}},
+        "tooltip": [
+            {"field": "side", "type": "nominal"},
+            {"field": "matchesPlayed", "type": "quantitative"},
+            {"field": "winPctSide", "type": "quantitative"},
+        ],
+    },
+}
+
+OPS_SCATTER_CHART_SPEC = {
+    "$schema": VEGA_LITE_SCHEMA,
+    "mark": SCATTER_MARK,
+    "height": 300,
+    "encoding": {
+        "x": MATCHES_PLAYED_X_ENCODING,
+        "y": WIN_PCT_Y_ENCODING,
+        "color": {
+            "field": "side",
+            "type": "nominal",
+            "title": "Lado",
+            "scale": {"domain": ["attacker", "defender"], "scheme": "set1"},
+        },
+        "tooltip": [
+            {"field": "operatorName", "type": "nominal"},
+            {"field": "side", "type": "nominal"},
+            {"field": "matchesPlayed", "type": "quantitative"},
+            {"field": "winPct", "type": "quantitative"},
+            {"field": "kdRatio", "type": "quantitative"},
+        ],
+    },
+}
+
+
+def _chart_data(df, spec):
+    """
+    Projeta df apenas nas colunas referenciadas pelo spec (entradas do fold + encoding
+    + tooltip), sem o índice, para reduzir o payload (Arrow, colunar) enviado ao navegador.
+    Campos gerados pelos transforms (fold/calculate) não existem no DataFrame e são ignorados.
+    """
+    encoding = spec["encoding"]
+    campos, gerados = [], set()
+    for transform in spec.get("transform", []):
+        campos += transform.get("fold", [])
+        saidas = transform["as"]
+        gerados.update([saidas] if isinstance(saidas, str) else saidas)
+    campos += [enc["field"] for canal, enc in encoding.items() if canal != "tooltip"]
+    campos += [enc["field"] for enc in encoding.get("tooltip", [])]
+    return df[[c for c in dict.fromkeys(campos) if c not in gerados]].reset_index(drop=True)
+
+
+# Cada aba é renderizada por um st.fragment: interações com widgets de dentro da aba
+# (jogador detalhado, botão do PDF) reexecutam só aquela aba, não o main() inteiro.
+# -------------------------------------------
+# Aba 1: Resumo Geral (Overview)
+# -------------------------------------------
+@st.fragment
+def _render_tab_overview(overview_df, df_overview_equipe):
+    st.header("✅ Resumo Geral")
+    if not overview_df.empty:
+        st.subheader("Por Jogador")
+        st.dataframe(
+            overview_df[OVERVIEW_COLS],
+            use_container_width=True,
+        )
+
+    if not df_overview_equipe.empty:
+        st.subheader("Total da Equipe")
+        st.dataframe(
+            df_overview_equipe[OVERVIEW_COLS],
+            use_container_width=True,
+        )
+
+
+# -------------------------------------------
+# Aba 2: Desempenho por Mapa
+# -------------------------------------------
+@st.fragment
+def _render_tab_maps(maps_df_agg, min_map_matches):
+    st.header("🗺️ Desempenho por Mapa")
+    if maps_df_agg.empty:
+        st.info("Não há dados de mapas disponíveis.")
+    else:
+        melhores5, piores5 = compute_best_worst_maps(maps_df_agg, min_map_matches)
+        if melhores5.empty:
+            # nenhum mapa passa no filtro: pula as tabelas (o frame vazio nem tem as colunas)
+            st.info(f"Nenhum mapa com ≥ {min_map_matches} partidas jogadas.")
+        else:
+            # projeção nas colunas exibidas feita uma vez e reutilizada pelas três tabelas
+            melhores5, piores5 = melhores5[MAP_COLS], piores5[MAP_COLS]
+
+            st.subheader("Top 5 Mapas com Maior Taxa de Vitória")
+            st.dataframe(
+                melhores5.head(5),
+                use_container_width=True,
+            )
+
+            st.subheader("Top 5 Mapas com Menor Taxa de Vitória")
+            st.dataframe(
+                piores5.head(5),
+                use_container_width=True,
+            )
+
+        # Gráfico comparativo: Top 10 mapas mais jogados x vitórias/derrotas
+        st.subheader("📈 Top 10 Mapas Mais Jogados (Vitórias x Derrotas)")
+        df_top10_mapa = maps_df_agg.sort_values("matchesPlayed", ascending=False).head(10)  # sem cópia: uso somente leitura
+        st.vega_lite_chart(_chart_data(df_top10_mapa, MAP_RESULT_CHART_SPEC), MAP_RESULT_CHART_SPEC, use_container_width=True)
+
+        if not melhores5.empty:
+            with st.expander("Mostrar todos os mapas ordenados por taxa de vitória"):
+                st.dataframe(
+                    melhores5,
+                    use_container_width=True,
+                )
+
+
+# -------------------------------------------
+# Aba 3: Desempenho por Lado (ATK vs DEF)
+# -------------------------------------------
+@st.fragment
+def _render_tab_sides(ops_df_agg_team, sides_df_agg):
+    st.header("⚔️ Desempenho por Lado (ATK vs DEF)")
+    if ops_df_agg_team.empty:
+        st.info("Não há dados de operadores para calcular desempenho por lado.")
+    else:
+        st.subheader("Tabela de Desempenho por Lado")
+        st.dataframe(
+            sides_df_agg[SIDE_COLS],
+            use_container_width=True,
+        )
+
+        st.subheader("📊 Comparativo de Lados (Vitórias x Derrotas)")
+        st.vega_lite_chart(_chart_data(sides_df_agg, SIDE_RESULT_CHART_SPEC), SIDE_RESULT_CHART_SPEC, use_container_width=True)
+
+        st.markdown(
+            """
+            - **matchesPlayed**: número total de partidas jogadas por operadores de cada lado  
+            - **matchesWon**: soma de vitórias de todos os operadores desse lado  
+            - **matchesLost**: partidas jogadas menos partidas vencidas  
+            - **winPctSide**: taxa de vitória do lado (`matchesWon / matchesPlayed * 100`)  
+            """
+        )
+
+
+# -------------------------------------------
+# Aba 4: Operadores (por Jogador)
+# -------------------------------------------
+@st.fragment
+def _render_tab_operators(
+    jogadores_selecionados,
+    ops_df_agg_player,
+    by_player,
+    by_player_filt,
+    min_operator_matches,
+):
+    st.header("🔫 Estatísticas de Operadores (por Jogador)")
+    if ops_df_agg_player.empty:
+        st.info("Não há dados de operadores disponíveis.")
+    else:
+        # Jogadores sem operadores acima do mínimo recebem só um aviso: tabelas e
+        # gráficos são montados apenas para quem tem dados
+        players_with_data = set(by_player_filt)
+        avisos = []
+        for player in jogadores_selecionados:
+            if by_player.get(player, _EMPTY_DF).empty:
+                avisos.append(f"- Nenhum operador encontrado para `{player}`.")
+            elif player not in players_with_data:
+                avisos.append(f"- Nenhum operador de `{player}` com ≥ {min_operator_matches} partidas.")
+        if avisos:
+            st.markdown("\n".join(avisos))
+
+        for player in (p for p in jogadores_selecionados if p in players_with_data):
+            st.subheader(f"📋 {player} – Operadores")
+            mais_jogados, maior_win, maior_kpm = compute_most_played_operators(
+                by_player[player], min_operator_matches, top_n=10
+            )
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("**Top 10 Mais Jogados**")
+                st.dataframe(
+                    mais_jogados[OP_TOP_COLS],
+                    use_container_width=True,
+                )
+                st.markdown("📊 Vitórias x Derrotas (Top 10 Mais Jogados)")
+                st.vega_lite_chart(_chart_data(mais_jogados, OPS_RESULT_CHART_SPEC), OPS_RESULT_CHART_SPEC, use_container_width=True)
+
+            with col2:
+                st.markdown("**Top 10 por Win %**")
+                st.dataframe(
+                    maior_win[OP_TOP_COLS],
+                    use_container_width=True,
+                )
+                st.markdown("**Top 10 por Kills/Match**")
+                st.dataframe(
+                    maior_kpm[OP_KPM_COLS],
+                    use_container_width=True,
+                )
+
+            st.markdown("---")  # Separador antes do próximo jogador
+
+
+# -------------------------------------------
+# Aba 5: Insights & Recomendações
+# -------------------------------------------
+@st.fragment
+def _render_tab_insights(
+    base_folder,
+    jogadores_selecionados,
+    overview_df,
+    maps_df_agg,
+    ops_df_agg_team,
+    ops_df_agg_player,
+    sides_df_agg,
+    by_player_filt,
+    best_ops_by_player,
+    top5_by_player_side,
+    min_operator_matches,
+    min_map_matches,
+):
+    st.header("💡 Insights & Recomendações")
+
+    if maps_df_agg.empty and ops_df_agg_player.empty:
+        st.info("Não há dados suficientes para gerar insights.")
+        return
+
+    # ------------------------------------------------------------
+    # 5.5.1) Melhor Mapa (apenas mapas com partidas >= min_map_matches)
+    # ------------------------------------------------------------
+    st.subheader("🏅 Melhor Mapa (― equipe)")
+    if maps_df_agg.empty:
+        st.write("Nenhum dado de mapa disponível.")
+    else:
+        df_maps_filtrado = maps_df_agg[maps_df_agg["matchesPlayed"] >= min_map_matches]  # sem cópia: uso somente leitura
+        if df_maps_filtrado.empty:
+            st.write(f"Nenhum mapa com ≥ {min_map_matches} partidas jogadas.")
+        else:
+            melhor_mapa = df_maps_filtrado.loc[df_maps_filtrado["winPct"].idxmax()]
+            st.markdown(
+                f"**Melhor mapa da equipe:** `{melhor_mapa['mapName']}` com _Win %_ de **{melhor_mapa['winPct']:.1f}%** "
+                f"em **{melhor_mapa['matchesPlayed']} partidas**."
+            )
+            st.markdown("#### Top 5 Mapas Filtrados (equipe)")
+            st.dataframe(
+                df_maps_filtrado.sort_values("winPct", ascending=False)[MAP_COLS].head(5),
+                use_container_width=True,
+            )
+            st.markdown("📊 Distribuição de Mapas (Partidas x Win %)")
+            st.vega_lite_chart(_chart_data(df_maps_filtrado, MAP_SCATTER_CHART_SPEC), MAP_SCATTER_CHART_SPEC, use_container_width=True)
+
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # 5.5.2) Melhor Lado (attacker vs defender) – equipe
+    # ------------------------------------------------------------
+    st.subheader("⚔️ Melhor Lado (ATK × DEF) (― equipe)")
+    if ops_df_agg_team.empty:
+        st.write("Nenhum dado de operador disponível para calcular desempenho por lado.")
+    else:
+        if sides_df_agg.empty:
+            st.write("Não há dados de lado.")
+        else:
+            best_side_row = sides_df_agg.loc[sides_df_agg.loc[sides_df_agg["matchesPlayed"] > 0, "winPctSide"].idxmax()]
+            st.markdown(
+                f"**Melhor lado da equipe:** `{best_side_row['side']}` com _Win %_ de **"
+                f"{best_side_row['winPctSide']:.1f}%** em **{best_side_row['matchesPlayed']} partidas**."
+            )
+            st.dataframe(
+                sides_df_agg[SIDE_COLS],
+                use_container_width=True,
+            )
+            st.vega_lite_chart(_chart_data(sides_df_agg, SIDE_WINPCT_CHART_SPEC), SIDE_WINPCT_CHART_SPEC, use_container_width=True)
+
+    st.markdown("---")
+
+    # Seções por jogador (5.5.3–5.5.5): por padrão, só o jogador escolhido é
+    # renderizado; "Mostrar todos" volta a detalhar todos os selecionados
+    jogador_detalhado = st.selectbox("Detalhar jogador", jogadores_selecionados)
+    mostrar_todos = st.checkbox("Mostrar todos", value=False)
+    jogadores_detalhe = jogadores_selecionados if mostrar_todos else [jogador_detalhado]
+
+    # ------------------------------------------------------------
+    # 5.5.3) MELHOR OPERADOR POR LADO (por Jogador)
+    # ------------------------------------------------------------
+    st.subheader("🥇 Melhor Operador por Lado (por Jogador)")
+    if ops_df_agg_player.empty:
+        st.write("Nenhum dado de operador disponível.")
+    else:
+        # Avisos acumulados num único markdown e melhores operadores de todos os
+        # jogadores detalhados numa única tabela (coluna player), em vez de N widgets
+        avisos, melhores_ops = [], []
+        for player in jogadores_detalhe:
+            if by_player_filt.get(player, _EMPTY_DF).empty:
+                avisos.append(f"- **{player}**: nenhum operador com ≥ {min_operator_matches} partidas.")
+            elif player not in best_ops_by_player:
+                avisos.append(f"- **{player}**: nenhum operador com ≥ {min_operator_matches} partidas em nenhum dos lados.")
+            else:
+                melhores_ops.append(best_ops_by_player[player])
+
+        if avisos:
+            st.markdown("\n".join(avisos))
+        if melhores_ops:
+            st.dataframe(pd.concat(melhores_ops, ignore_index=True), use_container_width=True)
+
+            for df_melhores_ops in melhores_ops:
+                player = df_melhores_ops["player"].iloc[0]
+                with st.container():
+                    st.markdown(f"📊 **{player}** – Distribuição de Operadores (Partidas x Win %)")
+                    st.vega_lite_chart(
+                        _chart_data(by_player_filt[player], OPS_SCATTER_CHART_SPEC), OPS_SCATTER_CHART_SPEC, use_container_width=True
+                    )
+
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # 5.5.4) Top Operadores por Lado (por Jogador)
+    # ------------------------------------------------------------
+    st.subheader("🎖️ Top Operadores por Lado (por Jogador)")
+    if ops_df_agg_player.empty:
+        st.write("Nenhum dado de operador disponível.")
+    else:
+        # Uma tabela por lado com os Top 5 de todos os jogadores detalhados
+        for lado in ["attacker", "defender"]:
+            st.markdown(f"**Top 5 Operadores ({lado.capitalize()})**")
+            avisos, tops = [], []
+            for player in jogadores_detalhe:
+                top_lado = top5_by_player_side.get((player, lado), _EMPTY_DF)
+                if top_lado.empty:
+                    avisos.append(f"- Nenhum operador {lado} de `{player}` com ≥ {min_operator_matches} partidas.")
+                else:
+                    tops.append(top_lado)
+
+            if avisos:
+                st.markdown("\n".join(avisos))
+            if tops:
+                st.dataframe(
+                    pd.concat(tops, ignore_index=True)[PLAYER_SIDE_TOP_COLS],
+                    use_container_width=True,
+                )
+
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # 5.5.5) Melhor Estilo de Jogo (Playstyle) por Jogador
+    # ------------------------------------------------------------
+    st.subheader("🎯 Melhor Estilo de Jogo (Playstyle) por Jogador")
+    linhas, playstyles_por_jogador = [], []
+    for player in jogadores_detalhe:
+        playstyles = load_player_playstyles(os.path.join(base_folder, player))
+        if playstyles is None:
+            linhas.append(f"- **{player}**: não foi possível extrair o playstyle (arquivo overview.json ausente).")
+        elif not playstyles:
+            linhas.append(f"- **{player}**: nenhum dado de playstyle encontrado no overview.json.")
+        else:
+            melhor_estilo, uso_percent = playstyles[0]
+            linhas.append(f"- **{player}** – **Melhor Estilo:** `{melhor_estilo}` com **{uso_percent:.1f}%** de uso.")
+            playstyles_por_jogador.append((player, playstyles))
+    st.markdown("\n".join(linhas))
+
+    for player, playstyles in playstyles_por_jogador:
+        with st.expander(f"Ver todos os playstyles ({len(playstyles)}) para {player}"):
+            df_play = pd.DataFrame(playstyles, columns=["Playstyle", "Uso (%)"])
+            st.dataframe(df_play, use_container_width=True)
+
+    st.markdown("---")
+    st.markdown(
+        """
+        **Observações Finais**  
+        - Ajuste `Mínimo de partidas por operador` e `Mínimo de partidas por mapa` na barra lateral para filtrar quais dados serão considerados no relatório.  
+        - O PDF gerado agora leva em consideração exatamente aqueles valores mínimos e inclui gráficos internos.  
+        """
+    )
+
+    # ------------------------------------------------------------
+    # Botão para gerar relatório em PDF
+    # ------------------------------------------------------------
+    st.subheader("📜 Gerar Relatório em PDF")
+    if st.button("🖨️ Gerar Relatório PDF"):
+        with st.status("Gerando relatório PDF...", expanded=False) as status:
+            pdf_bytes = build_pdf_report(
+                jogadores=jogadores_selecionados,
+                overview_df=overview_df,
+                maps_df_agg=maps_df_agg,
+                ops_df_agg_player=ops_df_agg_player,
+                ops_df_agg_team=ops_df_agg_team,
+                sides_df_agg=sides_df_agg,
+                min_operator_matches=min_operator_matches,
+                min_map_matches=min_map_matches,
+            )
+            status.update(label="Relatório PDF gerado.", state="complete")
+        st.success("Relatório PDF gerado com sucesso! Clique abaixo para baixar.")
+        st.download_button(
+            label="⬇️ Baixar Relatório PDF",
+            data=pdf_bytes,
+            file_name="relatorio_r6_siege.pdf",
+            mime="application/pdf",
+        )
+
+
 def main():
     st.set_page_config(page_title="R6 Siege Team Analyzer", layout="wide")
     st.title("🏠 R6 Siege Analytics Dashboard")
@@ -606,128 +1416,63 @@ def main():
     )
 
     # --------------------------------------------------------
-    # 7.3) Carregar JSONs e transformar em DataFrames para cada jogador
-    # --------------------------------------------------------
-    overview_list = []
-    maps_list = []
-    ops_list = []
-
-    overview_raw_by_player = {}
-
-    for player in jogadores_selecionados:
-        dir_player = os.path.join(base_folder, player)
-        overview_json, maps_json, ops_json = load_player_data(dir_player)
-
-        if overview_json is None:
-            st.warning(f"O arquivo `overview.json` não foi encontrado para `{player}`.")
-        else:
-            overview_raw_by_player[player] = overview_json
-            df_over = parse_overview_to_df(overview_json, player)
-            overview_list.append(df_over)
-
-        if maps_json is None:
-            st.warning(f"O arquivo `maps.json` não foi encontrado para `{player}`.")
-        else:
-            df_maps = parse_maps_to_df(maps_json, player)
-            maps_list.append(df_maps)
-
-        if ops_json is None:
-            st.warning(f"O arquivo `operators.json` não foi encontrado para `{player}`.")
-        else:
-            df_ops = parse_operators_to_df(ops_json, player)
-            ops_list.append(df_ops)
-
-    overview_df = pd.concat(overview_list, ignore_index=True) if overview_list else pd.DataFrame()
-    maps_df = pd.concat(maps_list, ignore_index=True) if maps_list else pd.DataFrame()
-    ops_df = pd.concat(ops_list, ignore_index=True) if ops_list else pd.DataFrame()
-
-    # --------------------------------------------------------
-    # 7.4) Agregação por equipe (somar todos os jogadores selecionados)
+    # 7.3) Carregar JSONs, transformar em DataFrames e agregar por equipe
+    #      (tudo em cache; os filtros de mínimo de partidas vêm depois)
     # --------------------------------------------------------
-    # 7.4.1) Overview agregado da equipe
-    if not overview_df.empty:
-        equipe_agg = {
-            "matchesPlayed": overview_df["matchesPlayed"].sum(),
-            "matchesWon": overview_df["matchesWon"].sum(),
-            "matchesLost": overview_df["matchesLost"].sum(),
-            "kills": overview_df["kills"].sum(),
-            "deaths": overview_df["deaths"].sum(),
-        }
-        equipe_agg["winPct"] = (equipe_agg["matchesWon"] / equipe_agg["matchesPlayed"] * 100) if equipe_agg["matchesPlayed"] > 0 else 0
-        equipe_agg["kdRatio"] = (equipe_agg["kills"] / equipe_agg["deaths"]) if equipe_agg["deaths"] > 0 else 0
-        df_overview_equipe = pd.DataFrame([{"player": "Equipe"} | equipe_agg])
-    else:
-        df_overview_equipe = pd.DataFrame()
-
-    # 7.4.2) Maps agregado
-    if not maps_df.empty:
-        maps_df_agg = maps_df.groupby("mapName").agg(
-            {
-                "matchesPlayed": "sum",
-                "matchesWon": "sum",
-                "kills": "sum",
-                "deaths": "sum",
-            }
-        ).reset_index()
-        maps_df_agg["matchesLost"] = maps_df_agg["matchesPlayed"] - maps_df_agg["matchesWon"]
-        maps_df_agg["winPct"] = maps_df_agg.apply(
-            lambda row: (row["matchesWon"] / row["matchesPlayed"] * 100) if row["matchesPlayed"] > 0 else 0,
-            axis=1,
-        )
-        maps_df_agg["kdRatio"] = maps_df_agg.apply(
-            lambda row: (row["kills"] / row["deaths"]) if row["deaths"] > 0 else 0,
-            axis=1,
+    (
+        overview_df,
+        df_overview_equipe,
+        maps_df_agg,
+        ops_df_agg_team,
+        ops_df_agg_player,
+        arquivos_ausentes,
+    ) = build_team_aggregates(base_folder, tuple(jogadores_selecionados))
+
+    for player, nome_arquivo in arquivos_ausentes:
+        st.warning(f"O arquivo `{nome_arquivo}` não foi encontrado para `{player}`.")
+
+    # Desempenho por lado calculado uma única vez por execução e reutilizado
+    # na aba 3, nos Insights (5.5.2) e no relatório PDF
+    sides_df_agg = compute_side_performance(ops_df_agg_team) if not ops_df_agg_team.empty else pd.DataFrame()
+
+    # Fatias de operadores por jogador (todas e filtradas pelo mínimo de partidas),
+    # reutilizadas na aba 4 e nos Insights. Jogadores sem operadores acima do
+    # mínimo não têm chave em by_player_filt (ler com .get(p, _EMPTY_DF))
+    by_player, by_player_filt = {}, {}
+    ops_df_agg_player_filt = _EMPTY_DF
+    if not ops_df_agg_player.empty:
+        by_player = {p: g for p, g in ops_df_agg_player.groupby("player", sort=False, observed=True)}
+        ops_df_agg_player_filt = ops_df_agg_player[ops_df_agg_player["matchesPlayed"] >= min_operator_matches]
+        by_player_filt = {p: g for p, g in ops_df_agg_player_filt.groupby("player", sort=False, observed=True)}
+
+    # Melhor operador (maior Win %) por (jogador, lado) em uma única redução
+    best_ops_by_player = {}
+    top5_by_player_side = {}
+    if not ops_df_agg_player_filt.empty:
+        ops_lados = ops_df_agg_player_filt[ops_df_agg_player_filt["side"].isin(["attacker", "defender"])]
+        best_idx = ops_lados.groupby(["player", "side"], observed=True)["winPct"].idxmax()
+        best_ops = (
+            ops_lados.loc[best_idx]
+            .assign(
+                matchesPlayed=lambda d: d["matchesPlayed"].astype(int),
+                # Taxas vêm em Float32 da agregação: arredonda em float64 para exibir o valor decimal exato
+                winPct=lambda d: d["winPct"].astype("float64").round(1),
+                killsPerMatch=lambda d: d["killsPerMatch"].astype("float64").round(2),
+            )[PLAYER_BEST_COLS]
+            .reset_index(drop=True)
         )
-    else:
-        maps_df_agg = pd.DataFrame()
-
-    # 7.4.3) Operadores agregado (e também separado por jogador)
-    if not ops_df.empty:
-        # **Agregado da equipe** (somando todos jogadores)
-        ops_df_agg_team = ops_df.groupby(["operatorName", "side"]).agg(
-            {
-                "matchesPlayed": "sum",
-                "matchesWon": "sum",
-                "kills": "sum",
-                "deaths": "sum",
-            }
-        ).reset_index()
-        ops_df_agg_team["matchesLost"] = ops_df_agg_team["matchesPlayed"] - ops_df_agg_team["matchesWon"]
-        ops_df_agg_team["winPct"] = ops_df_agg_team.apply(
-            lambda row: (row["matchesWon"] / row["matchesPlayed"] * 100) if row["matchesPlayed"] > 0 else 0,
-            axis=1,
-        )
-        ops_df_agg_team["kdRatio"] = ops_df_agg_team.apply(
-            lambda row: (row["kills"] / row["deaths"]) if row["deaths"] > 0 else 0,
-            axis=1,
-        )
-        ops_df_agg_team["killsPerMatch"] = ops_df_agg_team["kills"] / ops_df_agg_team["matchesPlayed"].replace(0, pd.NA)
+        best_ops_by_player = {p: g for p, g in best_ops.groupby("player", sort=False, observed=True)}
 
-        # **Agregado POR JOGADOR** (para usar na aba de Operadores e nos Insights)
-        ops_df_agg_player = ops_df.groupby(["player", "operatorName", "side"]).agg(
-            {
-                "matchesPlayed": "sum",
-                "matchesWon": "sum",
-                "kills": "sum",
-                "deaths": "sum",
-            }
-        ).reset_index()
-        ops_df_agg_player["matchesLost"] = ops_df_agg_player["matchesPlayed"] - ops_df_agg_player["matchesWon"]
-        ops_df_agg_player["winPct"] = ops_df_agg_player.apply(
-            lambda row: (row["matchesWon"] / row["matchesPlayed"] * 100) if row["matchesPlayed"] > 0 else 0,
-            axis=1,
-        )
-        ops_df_agg_player["kdRatio"] = ops_df_agg_player.apply(
-            lambda row: (row["kills"] / row["deaths"]) if row["deaths"] > 0 else 0,
-            axis=1,
+        # Top 5 operadores (Win %) por (jogador, lado): uma ordenação + head por grupo
+        top5_by_side = (
+            ops_lados.sort_values("winPct", ascending=False, kind="stable")
+            .groupby(["player", "side"], sort=False, observed=True)
+            .head(5)
         )
-        ops_df_agg_player["killsPerMatch"] = ops_df_agg_player["kills"] / ops_df_agg_player["matchesPlayed"].replace(0, pd.NA)
-    else:
-        ops_df_agg_team = pd.DataFrame()
-        ops_df_agg_player = pd.DataFrame()
+        top5_by_player_side = {k: g for k, g in top5_by_side.groupby(["player", "side"], sort=False, observed=True)}
 
     # --------------------------------------------------------
-    # 7.5) Configurar as abas do Dashboard
+    # 7.4) Configurar as abas do Dashboard
     # --------------------------------------------------------
     tabs = st.tabs(
         [
@@ -739,444 +1484,36 @@ def main():
         ]
     )
 
-    # -------------------------------------------
-    # Aba 1: Resumo Geral (Overview)
-    # -------------------------------------------
     with tabs[0]:
-        st.header("✅ Resumo Geral")
-        if not overview_df.empty:
-            st.subheader("Por Jogador")
-            st.dataframe(
-                overview_df[["player", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kills", "deaths", "kdRatio"]],
-                use_container_width=True,
-            )
-
-        if not df_overview_equipe.empty:
-            st.subheader("Total da Equipe")
-            st.dataframe(
-                df_overview_equipe[["player", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kills", "deaths", "kdRatio"]],
-                use_container_width=True,
-            )
-
-    # -------------------------------------------
-    # Aba 2: Desempenho por Mapa
-    # -------------------------------------------
+        _render_tab_overview(overview_df, df_overview_equipe)
     with tabs[1]:
-        st.header("🗺️ Desempenho por Mapa")
-        if maps_df_agg.empty:
-            st.info("Não há dados de mapas disponíveis.")
-        else:
-            melhores5, piores5 = compute_best_worst_maps(maps_df_agg, min_map_matches)
-
-            st.subheader("Top 5 Mapas com Maior Taxa de Vitória")
-            st.dataframe(
-                melhores5[["mapName", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kdRatio"]].head(5),
-                use_container_width=True,
-            )
-
-            st.subheader("Top 5 Mapas com Menor Taxa de Vitória")
-            st.dataframe(
-                piores5[["mapName", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kdRatio"]].head(5),
-                use_container_width=True,
-            )
-
-            # Gráfico comparativo: Top 10 mapas mais jogados x vitórias/derrotas
-            st.subheader("📈 Top 10 Mapas Mais Jogados (Vitórias x Derrotas)")
-            df_top10_mapa = maps_df_agg.sort_values("matchesPlayed", ascending=False).head(10).copy()
-            df_plot_mapa = df_top10_mapa[["mapName", "matchesWon", "matchesLost"]].melt(
-                id_vars=["mapName"],
-                value_vars=["matchesWon", "matchesLost"],
-                var_name="Resultado",
-                value_name="Contagem",
-            )
-            df_plot_mapa["Resultado"] = df_plot_mapa["Resultado"].map(
-                {
-                    "matchesWon": "Vitórias",
-                    "matchesLost": "Derrotas",
-                }
-            )
-
-            chart_mapa = (
-                alt.Chart(df_plot_mapa)
-                .mark_bar()
-                .encode(
-                    x=alt.X("mapName:N", sort="-y", title="Mapa"),
-                    y=alt.Y("Contagem:Q", title="Partidas"),
-                    color=alt.Color("Resultado:N", title="Resultado", scale=alt.Scale(domain=["Vitórias", "Derrotas"], scheme="set1")),
-                    tooltip=["mapName", "Resultado", "Contagem"],
-                )
-                .properties(height=350)
-            )
-            st.altair_chart(chart_mapa, use_container_width=True)
-
-            with st.expander("Mostrar todos os mapas ordenados por taxa de vitória"):
-                st.dataframe(
-                    melhores5[["mapName", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kdRatio"]],
-                    use_container_width=True,
-                )
-
-    # -------------------------------------------
-    # Aba 3: Desempenho por Lado (ATK vs DEF)
-    # -------------------------------------------
+        _render_tab_maps(maps_df_agg, min_map_matches)
     with tabs[2]:
-        st.header("⚔️ Desempenho por Lado (ATK vs DEF)")
-        if ops_df_agg_team.empty:
-            st.info("Não há dados de operadores para calcular desempenho por lado.")
-        else:
-            side_perf_team = compute_side_performance(ops_df_agg_team)
-            st.subheader("Tabela de Desempenho por Lado")
-            st.dataframe(
-                side_perf_team[["side", "matchesPlayed", "matchesWon", "matchesLost", "winPctSide"]],
-                use_container_width=True,
-            )
-
-            st.subheader("📊 Comparativo de Lados (Vitórias x Derrotas)")
-            df_plot_side = side_perf_team.melt(
-                id_vars=["side", "matchesPlayed"],
-                value_vars=["matchesWon", "matchesLost"],
-                var_name="Resultado",
-                value_name="Contagem",
-            )
-            df_plot_side["Resultado"] = df_plot_side["Resultado"].map(
-                {
-                    "matchesWon": "Vitórias",
-                    "matchesLost": "Derrotas",
-                }
-            )
-
-            chart_side = (
-                alt.Chart(df_plot_side)
-                .mark_bar()
-                .encode(
-                    x=alt.X("side:N", title="Lado"),
-                    y=alt.Y("Contagem:Q", title="Partidas"),
-                    color=alt.Color("Resultado:N", title="Resultado", scale=alt.Scale(domain=["Vitórias", "Derrotas"], scheme="set1")),
-                    tooltip=["side", "Resultado", "Contagem"],
-                )
-                .properties(height=350)
-            )
-            st.altair_chart(chart_side, use_container_width=True)
-
-            st.markdown(
-                """
-                - **matchesPlayed**: número total de partidas jogadas por operadores de cada lado  
-                - **matchesWon**: soma de vitórias de todos os operadores desse lado  
-                - **matchesLost**: partidas jogadas menos partidas vencidas  
-                - **winPctSide**: taxa de vitória do lado (`matchesWon / matchesPlayed * 100`)  
-                """
-            )
-
-    # -------------------------------------------
-    # Aba 4: Operadores (por Jogador)
-    # -------------------------------------------
+        _render_tab_sides(ops_df_agg_team, sides_df_agg)
     with tabs[3]:
-        st.header("🔫 Estatísticas de Operadores (por Jogador)")
-        if ops_df_agg_player.empty:
-            st.info("Não há dados de operadores disponíveis.")
-        else:
-            for player in jogadores_selecionados:
-                st.subheader(f"📋 {player} – Operadores")
-                df_jogador = ops_df_agg_player[ops_df_agg_player["player"] == player].copy()
-                if df_jogador.empty:
-                    st.write(f"Nenhum operador encontrado para `{player}`.")
-                    continue
-
-                df_filtrado = df_jogador[df_jogador["matchesPlayed"] >= min_operator_matches]
-                if df_filtrado.empty:
-                    st.write(f"Nenhum operador de `{player}` com ≥ {min_operator_matches} partidas.")
-                    continue
-
-                mais_jogados, maior_win, maior_kpm = compute_most_played_operators(df_jogador, min_operator_matches, top_n=10)
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    st.markdown("**Top 10 Mais Jogados**")
-                    st.dataframe(
-                        mais_jogados[["operatorName", "side", "matchesPlayed", "winPct", "kdRatio"]],
-                        use_container_width=True,
-                    )
-                    st.markdown("📊 Vitórias x Derrotas (Top 10 Mais Jogados)")
-                    df_plot_ops = mais_jogados[["operatorName", "matchesWon", "matchesLost"]].melt(
-                        id_vars=["operatorName"],
-                        value_vars=["matchesWon", "matchesLost"],
-                        var_name="Resultado",
-                        value_name="Contagem",
-                    )
-                    df_plot_ops["Resultado"] = df_plot_ops["Resultado"].map(
-                        {
-                            "matchesWon": "Vitórias",
-                            "matchesLost": "Derrotas",
-                        }
-                    )
-                    chart_ops = (
-                        alt.Chart(df_plot_ops)
-                        .mark_bar()
-                        .encode(
-                            x=alt.X("operatorName:N", sort="-y", title="Operador"),
-                            y=alt.Y("Contagem:Q", title="Partidas"),
-                            color=alt.Color("Resultado:N", title="Resultado", scale=alt.Scale(domain=["Vitórias", "Derrotas"], scheme="set1")),
-                            tooltip=["operatorName", "Resultado", "Contagem"],
-                        )
-                        .properties(height=300)
-                    )
-                    st.altair_chart(chart_ops, use_container_width=True)
-
-                with col2:
-                    st.markdown("**Top 10 por Win %**")
-                    st.dataframe(
-                        maior_win[["operatorName", "side", "matchesPlayed", "winPct", "kdRatio"]],
-                        use_container_width=True,
-                    )
-                    st.markdown("**Top 10 por Kills/Match**")
-                    st.dataframe(
-                        maior_kpm[["operatorName", "side", "matchesPlayed", "killsPerMatch", "kdRatio"]],
-                        use_container_width=True,
-                    )
-
-                st.markdown("---")  # Separador antes do próximo jogador
-
-    # -------------------------------------------
-    # Aba 5: Insights & Recomendações
-    # -------------------------------------------
+        _render_tab_operators(
+            jogadores_selecionados,
+            ops_df_agg_player,
+            by_player,
+            by_player_filt,
+            min_operator_matches,
+        )
     with tabs[4]:
-        st.header("💡 Insights & Recomendações")
-
-        if maps_df_agg.empty and ops_df_agg_player.empty:
-            st.info("Não há dados suficientes para gerar insights.")
-            st.stop()
-
-        # ------------------------------------------------------------
-        # 5.5.1) Melhor Mapa (apenas mapas com partidas >= min_map_matches)
-        # ------------------------------------------------------------
-        st.subheader("🏅 Melhor Mapa (― equipe)")
-        if maps_df_agg.empty:
-            st.write("Nenhum dado de mapa disponível.")
-        else:
-            df_maps_filtrado = maps_df_agg[maps_df_agg["matchesPlayed"] >= min_map_matches].copy()
-            if df_maps_filtrado.empty:
-                st.write(f"Nenhum mapa com ≥ {min_map_matches} partidas jogadas.")
-            else:
-                melhor_mapa = df_maps_filtrado.sort_values("winPct", ascending=False).iloc[0]
-                st.markdown(
-                    f"**Melhor mapa da equipe:** `{melhor_mapa['mapName']}` com _Win %_ de **{melhor_mapa['winPct']:.1f}%** "
-                    f"em **{melhor_mapa['matchesPlayed']} partidas**."
-                )
-                st.markdown("#### Top 5 Mapas Filtrados (equipe)")
-                st.dataframe(
-                    df_maps_filtrado.sort_values("winPct", ascending=False)[
-                        ["mapName", "matchesPlayed", "matchesWon", "matchesLost", "winPct", "kdRatio"]
-                    ].head(5),
-                    use_container_width=True,
-                )
-                st.markdown("📊 Distribuição de Mapas (Partidas x Win %)")
-                chart_scatter_map = (
-                    alt.Chart(df_maps_filtrado)
-                    .mark_circle(size=80, opacity=0.7)
-                    .encode(
-                        x=alt.X("matchesPlayed:Q", title="Partidas Jogadas"),
-                        y=alt.Y("winPct:Q", title="Win %"),
-                        tooltip=["mapName", "matchesPlayed", "winPct", "kdRatio"],
-                        color=alt.Color("winPct:Q", scale=alt.Scale(scheme="viridis"), title="Win %"),
-                    )
-                    .properties(height=350)
-                )
-                st.altair_chart(chart_scatter_map, use_container_width=True)
-
-        st.markdown("---")
-
-        # ------------------------------------------------------------
-        # 5.5.2) Melhor Lado (attacker vs defender) – equipe
-        # ------------------------------------------------------------
-        st.subheader("⚔️ Melhor Lado (ATK × DEF) (― equipe)")
-        if ops_df_agg_team.empty:
-            st.write("Nenhum dado de operador disponível para calcular desempenho por lado.")
-        else:
-            side_perf_team = compute_side_performance(ops_df_agg_team)
-            if side_perf_team.empty:
-                st.write("Não há dados de lado.")
-            else:
-                best_side_row = side_perf_team[side_perf_team["matchesPlayed"] > 0].sort_values("winPctSide", ascending=False).iloc[0]
-                st.markdown(
-                    f"**Melhor lado da equipe:** `{best_side_row['side']}` com _Win %_ de **"
-                    f"{best_side_row['winPctSide']:.1f}%** em **{best_side_row['matchesPlayed']} partidas**."
-                )
-                st.dataframe(
-                    side_perf_team[["side", "matchesPlayed", "matchesWon", "matchesLost", "winPctSide"]],
-                    use_container_width=True,
-                )
-                chart_side_pct = (
-                    alt.Chart(side_perf_team)
-                    .mark_bar()
-                    .encode(
-                        x=alt.X("side:N", title="Lado"),
-                        y=alt.Y("winPctSide:Q", title="Win %"),
-                        color=alt.Color("side:N", scale=alt.Scale(domain=["attacker", "defender"], scheme="set2")),
-                        tooltip=["side", "matchesPlayed", "winPctSide"],
-                    )
-                    .properties(height=300)
-                )
-                st.altair_chart(chart_side_pct, use_container_width=True)
-
-        st.markdown("---")
-
-        # ------------------------------------------------------------
-        # 5.5.3) MELHOR OPERADOR POR LADO (por Jogador)
-        # ------------------------------------------------------------
-        st.subheader("🥇 Melhor Operador por Lado (por Jogador)")
-        if ops_df_agg_player.empty:
-            st.write("Nenhum dado de operador disponível.")
-        else:
-            for player in jogadores_selecionados:
-                st.markdown(f"**🔹 {player}**")
-                df_jogador = ops_df_agg_player[ops_df_agg_player["player"] == player].copy()
-                df_jogador_filtrado = df_jogador[df_jogador["matchesPlayed"] >= min_operator_matches]
-                if df_jogador_filtrado.empty:
-                    st.write(f"  - Nenhum operador de `{player}` com ≥ {min_operator_matches} partidas.")
-                    continue
-
-                melhores_ops = []
-                for lado in ["attacker", "defender"]:
-                    df_lado = df_jogador_filtrado[df_jogador_filtrado["side"] == lado]
-                    if not df_lado.empty:
-                        melhor_op = df_lado.sort_values("winPct", ascending=False).iloc[0]
-                        melhores_ops.append(
-                            {
-                                "player": player,
-                                "side": lado,
-                                "operatorName": melhor_op["operatorName"],
-                                "matchesPlayed": int(melhor_op["matchesPlayed"]),
-                                "winPct": round(melhor_op["winPct"], 1),
-                                "killsPerMatch": round(melhor_op["kills"] / melhor_op["matchesPlayed"], 2),
-                            }
-                        )
-
-                if not melhores_ops:
-                    st.write(f"  - Nenhum operador de `{player}` com ≥ {min_operator_matches} partidas em nenhum dos lados.")
-                else:
-                    df_melhores_ops = pd.DataFrame(melhores_ops)
-                    st.dataframe(
-                        df_melhores_ops[["player", "side", "operatorName", "matchesPlayed", "winPct", "killsPerMatch"]],
-                        use_container_width=True,
-                    )
-
-                    st.markdown("  📊 Distribuição de Operadores (Partidas x Win %) deste jogador")
-                    chart_scatter_op = (
-                        alt.Chart(df_jogador_filtrado)
-                        .mark_circle(size=80, opacity=0.7)
-                        .encode(
-                            x=alt.X("matchesPlayed:Q", title="Partidas Jogadas"),
-                            y=alt.Y("winPct:Q", title="Win %"),
-                            color=alt.Color("side:N", title="Lado", scale=alt.Scale(domain=["attacker", "defender"], scheme="set1")),
-                            tooltip=["operatorName", "side", "matchesPlayed", "winPct", "kdRatio"],
-                        )
-                        .properties(height=300)
-                    )
-                    st.altair_chart(chart_scatter_op, use_container_width=True)
-
-                st.markdown("---")  # Separador antes do próximo jogador
-
-        st.markdown("---")
-
-        # ------------------------------------------------------------
-        # 5.5.4) Top Operadores por Lado (por Jogador)
-        # ------------------------------------------------------------
-        st.subheader("🎖️ Top Operadores por Lado (por Jogador)")
-        if ops_df_agg_player.empty:
-            st.write("Nenhum dado de operador disponível.")
-        else:
-            for player in jogadores_selecionados:
-                st.markdown(f"**🔹 {player}**")
-                df_jogador = ops_df_agg_player[ops_df_agg_player["player"] == player].copy()
-                df_jogador_filtrado = df_jogador[df_jogador["matchesPlayed"] >= min_operator_matches]
-                if df_jogador_filtrado.empty:
-                    st.write(f"  - Nenhum operador de `{player}` com ≥ {min_operator_matches} partidas.")
-                    continue
-
-                for lado in ["attacker", "defender"]:
-                    st.markdown(f"  • **Top 5 Operadores ({lado.capitalize()})**")
-                    df_lado_top = df_jogador_filtrado[df_jogador_filtrado["side"] == lado].copy()
-                    if df_lado_top.empty:
-                        st.write(f"    - Nenhum operador {lado} de `{player}` com ≥ {min_operator_matches} partidas.")
-                    else:
-                        top_lado = df_lado_top.sort_values("winPct", ascending=False).head(5)
-                        st.dataframe(
-                            top_lado[
-                                [
-                                    "operatorName",
-                                    "matchesPlayed",
-                                    "winPct",
-                                    "killsPerMatch",
-                                    "kdRatio",
-                                ]
-                            ].reset_index(drop=True),
-                            use_container_width=True,
-                        )
-                st.markdown("---")  # Separador antes do próximo jogador
-
-        st.markdown("---")
-
-        # ------------------------------------------------------------
-        # 5.5.5) Melhor Estilo de Jogo (Playstyle) por Jogador
-        # ------------------------------------------------------------
-        st.subheader("🎯 Melhor Estilo de Jogo (Playstyle) por Jogador")
-        for player in jogadores_selecionados:
-            st.markdown(f"**🔹 {player}**")
-            overview_json = overview_raw_by_player.get(player)
-            if overview_json is None:
-                st.write("  - Não foi possível extrair o playstyle (arquivo overview.json ausente).")
-                continue
-
-            playstyles = extract_playstyles(overview_json)
-            if not playstyles:
-                st.write("  - Nenhum dado de playstyle encontrado no overview.json.")
-                continue
-
-            melhor_estilo, uso_percent = playstyles[0]
-            st.markdown(f"  - **Melhor Estilo:** `{melhor_estilo}` com **{uso_percent:.1f}%** de uso.")
-
-            with st.expander(f"Ver todos os playstyles ({len(playstyles)}) para {player}"):
-                df_play = pd.DataFrame(playstyles, columns=["Playstyle", "Uso (%)"])
-                st.dataframe(df_play, use_container_width=True)
-
-        st.markdown("---")
-        st.markdown(
-            """
-            **Observações Finais**  
-            - Ajuste `Mínimo de partidas por operador` e `Mínimo de partidas por mapa` na barra lateral para filtrar quais dados serão considerados no relatório.  
-            - O PDF gerado agora leva em consideração exatamente aqueles valores mínimos e inclui gráficos internos.  
-            """
+        _render_tab_insights(
+            base_folder,
+            jogadores_selecionados,
+            overview_df,
+            maps_df_agg,
+            ops_df_agg_team,
+            ops_df_agg_player,
+            sides_df_agg,
+            by_player_filt,
+            best_ops_by_player,
+            top5_by_player_side,
+            min_operator_matches,
+            min_map_matches,
         )
 
-        # ------------------------------------------------------------
-        # Botão para gerar relatório em PDF
-        # ------------------------------------------------------------
-        # 1) Garantir que sides_df_agg já esteja calculado
-        if not ops_df_agg_team.empty:
-            sides_df_agg = compute_side_performance(ops_df_agg_team)
-        else:
-            sides_df_agg = pd.DataFrame()
-
-        st.subheader("📜 Gerar Relatório em PDF")
-        if st.button("🖨️ Gerar Relatório PDF"):
-            pdf_bytes = create_pdf_report(
-                jogadores=jogadores_selecionados,
-                overview_raw_by_player=overview_raw_by_player,
-                maps_df_agg=maps_df_agg,
-                ops_df_agg_player=ops_df_agg_player,
-                ops_df_agg_team=ops_df_agg_team,
-                sides_df_agg=sides_df_agg,
-                min_operator_matches=min_operator_matches,
-                min_map_matches=min_map_matches,
-            )
-            st.success("Relatório PDF gerado com sucesso! Clique abaixo para baixar.")
-            st.download_button(
-                label="⬇️ Baixar Relatório PDF",
-                data=pdf_bytes,
-                file_name="relatorio_r6_siege.pdf",
-                mime="application/pdf",
-            )
-
 
 if __name__ == "__main__":
     main()